@@ -24,41 +24,64 @@ ${MARK}
 </script>
 `;
 
+const HTML_FILE_RE = /\.html?$/i;
+const LINK_HINT_RE = /back-to-dashboard/i;
+const LINK_RE = /<a([^>]*?)class="([^"]*?\bback-to-dashboard\b[^"]*?)"([^>]*)>[\s\S]*?<\/a>/i;
+const HAS_LINK_RE = /class="[^"]*\bback-to-dashboard\b[^"]*"/;
+const BODY_HTML_END_RE = /<\/body>\s*<\/html>\s*$/i;
+const BODY_RE = /<\/body>/i;
+
 function walk(dir) {
-  for (const name of fs.readdirSync(dir)) {
+  // withFileTypes: dosya türü readdir'den gelir, her giriş için ayrı stat yok
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const name = entry.name;
     const p = path.join(dir, name);
-    const stat = fs.statSync(p);
-    if (stat.isDirectory()) {
+    if (entry.isDirectory()) {
       // .git ve node_modules’i atla
       if (name === '.git' || name === 'node_modules') continue;
       walk(p);
-    } else if (stat.isFile() && /\.html?$/i.test(name)) {
+    } else if (entry.isFile() && HTML_FILE_RE.test(name)) {
       inject(p);
     }
   }
 }
 
 function inject(file) {
-  let html = fs.readFileSync(file, 'utf8');
+  const buf = fs.readFileSync(file);
+
+  // Zaten enjekte edilmişse dokunma (MARK ASCII; utf8 çözmeden byte'larda ara)
+  if (buf.includes(MARK)) return;
+
+  let html = buf.toString('utf8');
 
-  // Zaten enjekte edilmişse dokunma
-  if (html.includes(MARK)) return;
+  // back-to-dashboard hiç geçmiyorsa aşağıdaki regex'lerin yapacağı bir şey yok
+  if (!LINK_HINT_RE.test(html)) return;
 
   // Linki standardize et (varsa)
-  html = html.replace(
-    /<a([^>]*?)class="([^"]*?\bback-to-dashboard\b[^"]*?)"([^>]*)>[\s\S]*?<\/a>/i,
-    '<a class="back-to-dashboard">← Back to Main Dashboard</a>'
-  );
+  let standardized = false;
+  html = html.replace(LINK_RE, () => {
+    standardized = true;
+    return '<a class="back-to-dashboard">← Back to Main Dashboard</a>';
+  });
 
   // back-to-dashboard linki hiç yoksa dosyayı atla (isteğe bağlı)
-  if (!/class="[^"]*\bback-to-dashboard\b[^"]*"/.test(html)) return;
+  // (standardize edildiyse link zaten var; HTML'i tekrar taramaya gerek yok)
+  if (!standardized && !HAS_LINK_RE.test(html)) return;
 
   // </body></html> öncesine script’i ekle
-  if (/<\/body>\s*<\/html>\s*$/i.test(html)) {
-    html = html.replace(/<\/body>\s*<\/html>\s*$/i, `${INJECT}\n</body>\n</html>`);
-  } else if (/<\/body>/i.test(html)) {
-    html = html.replace(/<\/body>/i, `${INJECT}\n</body>`);
-  } else {
+  // (önce test() sonra replace() yerine tek geçiş: eşleşme callback'te işaretlenir)
+  let placed = false;
+  html = html.replace(BODY_HTML_END_RE, () => {
+    placed = true;
+    return `${INJECT}\n</body>\n</html>`;
+  });
+  if (!placed) {
+    html = html.replace(BODY_RE, () => {
+      placed = true;
+      return `${INJECT}\n</body>`;
+    });
+  }
+  if (!placed) {
     // Çok nadir: body yoksa en sona ekle
     html += `\n${INJECT}\n`;
   }